@@ -1038,6 +1038,11 @@ def main():
             def parse_json_event(json: T_JSON_DICT) -> typing.Any:
                 ''' Parse a JSON dictionary into a CDP event. '''
                 return _event_parsers[json['method']].from_json(json['params'])
+
+
+            def get_event_class(method: str) -> typing.Optional[type]:
+                ''' Get the event class registered for a CDP method name, if any. '''
+                return _event_parsers.get(method)
             """
             )
         )
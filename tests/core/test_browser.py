@@ -1,3 +1,9 @@
+import asyncio
+import logging
+import pathlib
+
+import pytest
+
 import zendriver as zd
 
 
@@ -11,3 +17,41 @@ async def test_update_target_sets_target_title(browser: zd.Browser):
     page = await browser.get("https://example.com")
     await page.update_target()
     assert page.target.title == "Example Domain"
+
+
+async def test_target_info_changed_updates_target(
+    browser: zd.Browser, caplog: pytest.LogCaptureFixture
+):
+    # target info used to be updated only when debug logging was enabled
+    caplog.set_level(logging.INFO, logger="zendriver.core.browser")
+    page = browser.main_tab
+    await page.send(zd.cdp.page.navigate("https://example.com"))
+    for _ in range(40):
+        if page.target.title == "Example Domain":
+            break
+        await asyncio.sleep(0.25)
+    assert page.target.url == "https://example.com/"
+    assert page.target.title == "Example Domain"
+
+
+async def test_cookie_jar_save_and_load_only_matching_cookies(
+    browser: zd.Browser, tmp_path: pathlib.Path
+):
+    await browser.cookies.set_all(
+        [
+            zd.cdp.network.CookieParam(
+                name="kept", value="1", domain="example.com", path="/"
+            ),
+            zd.cdp.network.CookieParam(
+                name="dropped", value="2", domain="example.org", path="/"
+            ),
+        ]
+    )
+    session_file = tmp_path / "session.dat"
+    await browser.cookies.save(session_file, pattern=r"example\.com")
+    await browser.cookies.clear()
+    assert await browser.cookies.get_all() == []
+
+    await browser.cookies.load(session_file)
+    cookies = await browser.cookies.get_all()
+    assert [(cookie.name, cookie.value) for cookie in cookies] == [("kept", "1")]
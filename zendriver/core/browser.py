@@ -5,6 +5,7 @@ import http
 import http.cookiejar
 import json
 import logging
+import math
 import pathlib
 import pickle
 import re
@@ -13,7 +14,7 @@ import urllib.parse
 import urllib.request
 import warnings
 from collections import defaultdict
-from typing import List, Tuple, Union
+from typing import Dict, List, Tuple, Union, cast
 
 import asyncio_atexit
 
@@ -25,6 +26,16 @@ from .connection import Connection
 
 logger = logging.getLogger(__name__)
 
+_GRANTABLE_PERMISSIONS = [
+    permission
+    for permission in cdp.browser.PermissionType
+    if permission
+    not in (
+        cdp.browser.PermissionType.FLASH,
+        cdp.browser.PermissionType.CAPTURED_SURFACE_CONTROL,
+    )
+]
+
 
 class Browser:
     """
@@ -121,6 +132,7 @@ class Browser:
 
         self.targets: List = []
         """current targets (all types)"""
+        self._targets_by_id: Dict[str, Connection] = {}
         self.info: ContraDict | None = None
         self._target = None
         self._process = None
@@ -128,7 +140,7 @@ class Browser:
         self._keep_user_data_dir = None
         self._is_updating = asyncio.Event()
         self.connection = None
-        logger.debug("Session object initialized: %s" % vars(self))
+        logger.debug("Session object initialized: %s", vars(self))
 
     @property
     def websocket_url(self):
@@ -140,15 +152,17 @@ class Browser:
     @property
     def main_tab(self) -> tab.Tab:
         """returns the target which was launched with the browser"""
-        return sorted(self.targets, key=lambda x: x.type_ == "page", reverse=True)[0]
+        for target in self.targets:
+            if target.type_ == "page":
+                return target
+        return self.targets[0]
 
     @property
     def tabs(self) -> List[tab.Tab]:
         """returns the current targets which are of type "page"
         :return:
         """
-        tabs = filter(lambda item: item.type_ == "page", self.targets)
-        return list(tabs)
+        return [item for item in self.targets if item.type_ == "page"]
 
     @property
     def cookies(self) -> CookieJar:
@@ -188,25 +202,21 @@ class Browser:
         if isinstance(event, cdp.target.TargetInfoChanged):
             target_info = event.target_info
 
-            current_tab = next(
-                filter(
-                    lambda item: item.target_id == target_info.target_id, self.targets
-                )
-            )
+            current_tab = self._targets_by_id.get(target_info.target_id)
+            if current_tab is None:
+                return
             current_target = current_tab.target
 
-            if logger.getEffectiveLevel() <= 10:
+            if current_target is not None and logger.isEnabledFor(logging.DEBUG):
                 changes = util.compare_target_info(current_target, target_info)
-                changes_string = ""
-                for change in changes:
-                    key, old, new = change
-                    changes_string += f"\n{key}: {old} => {new}\n"
+                changes_string = "".join(
+                    f"\n{key}: {old} => {new}\n" for key, old, new in changes
+                )
                 logger.debug(
-                    "target #%d has changed: %s"
-                    % (self.targets.index(current_tab), changes_string)
+                    "target %s has changed: %s", target_info.target_id, changes_string
                 )
 
-                current_tab.target = target_info
+            current_tab.target = target_info
 
         elif isinstance(event, cdp.target.TargetCreated):
             target_info = event.target_info
@@ -223,17 +233,15 @@ class Browser:
             )
 
             self.targets.append(new_target)
+            self._targets_by_id[target_info.target_id] = new_target
 
             logger.debug("target #%d created => %s", len(self.targets), new_target)
 
         elif isinstance(event, cdp.target.TargetDestroyed):
-            current_tab = next(
-                filter(lambda item: item.target_id == event.target_id, self.targets)
-            )
-            logger.debug(
-                "target removed. id # %d => %s"
-                % (self.targets.index(current_tab), current_tab)
-            )
+            current_tab = self._targets_by_id.pop(event.target_id, None)
+            if current_tab is None:
+                return
+            logger.debug("target removed. id %s => %s", event.target_id, current_tab)
             self.targets.remove(current_tab)
 
     async def get(
@@ -261,12 +269,7 @@ class Browser:
                 )
             )
             # get the connection matching the new target_id from our inventory
-            connection: tab.Tab = next(
-                filter(
-                    lambda item: item.type_ == "page" and item.target_id == target_id,
-                    self.targets,
-                )
-            )
+            connection = cast(tab.Tab, self._targets_by_id[target_id])
             connection.browser = self
 
         else:
@@ -349,14 +352,19 @@ class Browser:
 
         self._http = HTTPApi((self.config.host, self.config.port))
         util.get_registered_instances().add(self)
-        await asyncio.sleep(self.config.browser_connection_timeout)
-        for attempt in range(self.config.browser_connection_max_tries):
+        max_tries = self.config.browser_connection_max_tries
+        if not connect_existing:
+            # a freshly launched browser rarely answers the immediate first probe,
+            # so allow one more to keep the last probe at max_tries * timeout
+            max_tries += 1
+        for attempt in range(max_tries):
             try:
                 self.info = ContraDict(await self._http.get("version"), silent=True)
                 break  # Exit loop if successful
             except Exception:
-                if attempt == self.config.browser_connection_max_tries - 1:
+                if attempt == max_tries - 1:
                     logger.debug("Could not start", exc_info=True)
+                    break
                 await asyncio.sleep(self.config.browser_connection_timeout)
 
         if not self.info:
@@ -440,14 +448,11 @@ class Browser:
         if not self.connection:
             raise RuntimeError("Browser not yet started. use await browser.start()")
 
-        permissions = list(cdp.browser.PermissionType)
-        permissions.remove(cdp.browser.PermissionType.FLASH)
-        permissions.remove(cdp.browser.PermissionType.CAPTURED_SURFACE_CONTROL)
-        await self.connection.send(cdp.browser.grant_permissions(permissions))
+        await self.connection.send(
+            cdp.browser.grant_permissions(_GRANTABLE_PERMISSIONS)
+        )
 
     async def tile_windows(self, windows=None, max_columns: int = 0):
-        import math
-
         import mss
 
         m = mss.mss()
@@ -466,8 +471,8 @@ class Browser:
             tabs = windows
         else:
             tabs = self.tabs
-        for tab_ in tabs:
-            window_id, bounds = await tab_.get_window()
+        windows_info = await asyncio.gather(*(tab_.get_window() for tab_ in tabs))
+        for tab_, (window_id, bounds) in zip(tabs, windows_info):
             distinct_windows[window_id].append(tab_)
 
         num_windows = len(distinct_windows)
@@ -482,6 +487,7 @@ class Browser:
 
         distinct_windows_iter = iter(distinct_windows.values())
         grid = []
+        resizes = []
         for x in range(req_cols):
             for y in range(req_rows):
                 try:
@@ -492,15 +498,13 @@ class Browser:
                     continue
                 tab_ = tabs[0]
 
-                try:
-                    pos = [x * box_w, y * box_h, box_w, box_h]
-                    grid.append(pos)
-                    await tab_.set_window_size(*pos)
-                except Exception:
-                    logger.info(
-                        "could not set window size. exception => ", exc_info=True
-                    )
-                    continue
+                pos = [x * box_w, y * box_h, box_w, box_h]
+                grid.append(pos)
+                resizes.append(tab_.set_window_size(*pos))
+
+        for result in await asyncio.gather(*resizes, return_exceptions=True):
+            if isinstance(result, Exception):
+                logger.info("could not set window size. exception => ", exc_info=result)
         return grid
 
     async def _get_targets(self) -> List[cdp.target.TargetInfo]:
@@ -513,23 +517,21 @@ class Browser:
         targets: List[cdp.target.TargetInfo]
         targets = await self._get_targets()
         for t in targets:
-            for existing_tab in self.targets:
-                existing_target = existing_tab.target
-                if existing_target.target_id == t.target_id:
-                    existing_tab.target.__dict__.update(t.__dict__)
-                    break
-            else:
-                self.targets.append(
-                    Connection(
-                        (
-                            f"ws://{self.config.host}:{self.config.port}"
-                            f"/devtools/page"  # all types are 'page' somehow
-                            f"/{t.target_id}"
-                        ),
-                        target=t,
-                        _owner=self,
-                    )
-                )
+            existing_tab = self._targets_by_id.get(t.target_id)
+            if existing_tab is not None:
+                existing_tab.target.__dict__.update(t.__dict__)
+                continue
+            new_target = Connection(
+                (
+                    f"ws://{self.config.host}:{self.config.port}"
+                    f"/devtools/page"  # all types are 'page' somehow
+                    f"/{t.target_id}"
+                ),
+                target=t,
+                _owner=self,
+            )
+            self.targets.append(new_target)
+            self._targets_by_id[t.target_id] = new_target
 
         await asyncio.sleep(0)
 
@@ -541,7 +543,8 @@ class Browser:
             raise exc_type(exc_val)
 
     def __iter__(self):
-        self._i = self.tabs.index(self.main_tab)
+        self._iter_tabs = self.tabs
+        self._i = self._iter_tabs.index(self.main_tab)
         return self
 
     def __reversed__(self):
@@ -549,19 +552,13 @@ class Browser:
 
     def __next__(self):
         try:
-            return self.tabs[self._i]
-        except IndexError:
-            del self._i
+            tab_ = self._iter_tabs[self._i]
+        except (IndexError, AttributeError):
+            self.__dict__.pop("_i", None)
+            self.__dict__.pop("_iter_tabs", None)
             raise StopIteration
-        except AttributeError:
-            del self._i
-            raise StopIteration
-        finally:
-            if hasattr(self, "_i"):
-                if self._i != len(self.tabs):
-                    self._i += 1
-                else:
-                    del self._i
+        self._i += 1
+        return tab_
 
     async def stop(self):
         if not self.connection and not self._process:
@@ -575,11 +572,9 @@ class Browser:
             self._process.terminate()
             logger.debug("gracefully stopping browser process")
             # wait 3 seconds for the browser to stop
-            for _ in range(12):
-                if self._process.returncode is not None:
-                    break
-                await asyncio.sleep(0.25)
-            else:
+            try:
+                await asyncio.wait_for(self._process.wait(), timeout=3)
+            except asyncio.TimeoutError:
                 logger.debug("browser process did not stop. killing it")
                 self._process.kill()
                 logger.debug("killed browser process")
@@ -591,13 +586,16 @@ class Browser:
     async def _cleanup_temporary_profile(self) -> None:
         if not self.config or self.config.uses_custom_data_dir:
             return
+        if not pathlib.Path(self.config.user_data_dir).is_dir():
+            return
 
         for attempt in range(5):
             try:
                 shutil.rmtree(self.config.user_data_dir, ignore_errors=False)
                 logger.debug(
-                    "successfully removed temp profile %s" % self.config.user_data_dir
+                    "successfully removed temp profile %s", self.config.user_data_dir
                 )
+                break
             except FileNotFoundError:
                 break
             except (PermissionError, OSError) as e:
@@ -615,9 +613,26 @@ class Browser:
 
 
 class CookieJar:
+    __slots__ = ("_browser",)
+
     def __init__(self, browser: Browser):
         self._browser = browser
-        # self._connection = connection
+
+    def _get_connection(self) -> Connection:
+        """
+        returns the first open tab, or the browser connection when no tab is open
+        """
+        connection: Connection | None = next(
+            (
+                tab_
+                for tab_ in self._browser.targets
+                if tab_.type_ == "page" and not tab_.closed
+            ),
+            self._browser.connection,
+        )
+        if not connection:
+            raise RuntimeError("Browser not yet started. use await browser.start()")
+        return connection
 
     async def get_all(
         self, requests_cookie_format: bool = False
@@ -631,16 +646,7 @@ class CookieJar:
         :rtype:
 
         """
-        connection: Connection | None = None
-        for tab_ in self._browser.tabs:
-            if tab_.closed:
-                continue
-            connection = tab_
-            break
-        else:
-            connection = self._browser.connection
-        if not connection:
-            raise RuntimeError("Browser not yet started. use await browser.start()")
+        connection = self._get_connection()
 
         cookies = await connection.send(cdp.storage.get_cookies())
         if requests_cookie_format:
@@ -668,16 +674,7 @@ class CookieJar:
         :return:
         :rtype:
         """
-        connection: Connection | None = None
-        for tab_ in self._browser.tabs:
-            if tab_.closed:
-                continue
-            connection = tab_
-            break
-        else:
-            connection = self._browser.connection
-        if not connection:
-            raise RuntimeError("Browser not yet started. use await browser.start()")
+        connection = self._get_connection()
 
         await connection.send(cdp.storage.set_cookies(cookies))
 
@@ -701,28 +698,10 @@ class CookieJar:
         """
         compiled_pattern = re.compile(pattern)
         save_path = pathlib.Path(file).resolve()
-        connection: Connection | None = None
-        for tab_ in self._browser.tabs:
-            if tab_.closed:
-                continue
-            connection = tab_
-            break
-        else:
-            connection = self._browser.connection
-        if not connection:
-            raise RuntimeError("Browser not yet started. use await browser.start()")
-
-        cookies = await connection.send(cdp.storage.get_cookies())
-        # if not connection:
-        #     return
-        # if not connection.websocket:
-        #     return
-        # if connection.websocket.closed:
-        #     return
         cookies = await self.get_all(requests_cookie_format=False)
         included_cookies = []
         for cookie in cookies:
-            for match in compiled_pattern.finditer(str(cookie.__dict__)):
+            if self._matches_pattern(compiled_pattern, cookie):
                 logger.debug(
                     "saved cookie for matching pattern '%s' => (%s: %s)",
                     compiled_pattern.pattern,
@@ -730,8 +709,7 @@ class CookieJar:
                     cookie.value,
                 )
                 included_cookies.append(cookie)
-                break
-        pickle.dump(cookies, save_path.open("w+b"))
+        pickle.dump(included_cookies, save_path.open("w+b"))
 
     async def load(self, file: PathLike = ".session.dat", pattern: str = ".*"):
         """
@@ -751,14 +729,12 @@ class CookieJar:
         :return:
         :rtype:
         """
-        import re
-
         compiled_pattern = re.compile(pattern)
         save_path = pathlib.Path(file).resolve()
         cookies = pickle.load(save_path.open("r+b"))
         included_cookies = []
         for cookie in cookies:
-            for match in compiled_pattern.finditer(str(cookie.__dict__)):
+            if self._matches_pattern(compiled_pattern, cookie):
                 included_cookies.append(cookie)
                 logger.debug(
                     "loaded cookie for matching pattern '%s' => (%s: %s)",
@@ -766,9 +742,21 @@ class CookieJar:
                     cookie.name,
                     cookie.value,
                 )
-                break
         await self.set_all(included_cookies)
 
+    @staticmethod
+    def _matches_pattern(
+        pattern: re.Pattern,
+        cookie: Union[cdp.network.Cookie, http.cookiejar.Cookie],
+    ) -> bool:
+        """
+        whether the domain, name or value field of the cookie matches the pattern
+        """
+        return any(
+            field is not None and pattern.search(field) is not None
+            for field in (cookie.domain, cookie.name, cookie.value)
+        )
+
     async def clear(self):
         """
         clear current cookies
@@ -778,16 +766,7 @@ class CookieJar:
         :return:
         :rtype:
         """
-        connection: Connection | None = None
-        for tab_ in self._browser.tabs:
-            if tab_.closed:
-                continue
-            connection = tab_
-            break
-        else:
-            connection = self._browser.connection
-        if not connection:
-            raise RuntimeError("Browser not yet started. use await browser.start()")
+        connection = self._get_connection()
 
         await connection.send(cdp.storage.clear_cookies())
 
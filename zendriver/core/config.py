@@ -1,4 +1,5 @@
 import ctypes
+import functools
 import logging
 import os
 import pathlib
@@ -257,10 +258,14 @@ def temp_profile_dir():
     return path
 
 
+@functools.lru_cache(maxsize=1)
 def find_chrome_executable() -> PathLike:
     """
     Finds the chrome, beta, canary, chromium executable
     and returns the disk path
+
+    the result is cached, so repeated Config objects don't probe every
+    candidate path on disk again.
     """
     candidates = []
     if is_posix:
@@ -294,12 +299,12 @@ def find_chrome_executable() -> PathLike:
     rv = []
     for candidate in candidates:
         if os.path.exists(candidate) and os.access(candidate, os.X_OK):
-            logger.debug("%s is a valid candidate... " % candidate)
+            logger.debug("%s is a valid candidate... ", candidate)
             rv.append(candidate)
         else:
             logger.debug(
-                "%s is not a valid candidate because don't exist or not executable "
-                % candidate
+                "%s is not a valid candidate because don't exist or not executable ",
+                candidate,
             )
 
     winner = None
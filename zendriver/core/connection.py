@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import asyncio
 import collections
+import functools
 import inspect
 import itertools
 import json
@@ -26,6 +27,32 @@ import websockets.asyncio.client
 from .. import cdp
 from . import util
 
+try:
+    import orjson
+
+    def _json_dumps(obj: Any) -> str:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+        except TypeError:
+            # e.g. integers beyond 64 bits or lone surrogates, which json accepts
+            return json.dumps(obj)
+
+    def _json_loads(data: str | bytes) -> Any:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # e.g. lone surrogates, NaN or out of range floats, which json accepts
+            return json.loads(data)
+
+except ImportError:
+
+    def _json_dumps(obj: Any) -> str:
+        return json.dumps(obj)
+
+    def _json_loads(data: str | bytes) -> Any:
+        return json.loads(data)
+
+
 if TYPE_CHECKING:
     from zendriver.core.browser import Browser
 
@@ -41,6 +68,43 @@ TargetType = Union[cdp.target.TargetInfo, cdp.target.TargetID]
 logger = logging.getLogger("uc.connection")
 
 
+@functools.lru_cache(maxsize=None)
+def _get_domain_events(domain: types.ModuleType) -> tuple[Any, ...]:
+    """
+    returns the event types found in a cdp domain module.
+    cached, since the module contents never change at runtime.
+    """
+    events = []
+    for name, obj in inspect.getmembers_static(domain):
+        if name.isupper():
+            continue
+        if not name[0].isupper():
+            continue
+        if type(obj) is type:
+            continue
+        if inspect.isbuiltin(obj):
+            continue
+        events.append(obj)
+    return tuple(events)
+
+
+def _inspect_handler(handler: Union[Callable, Awaitable]) -> tuple[bool, bool]:
+    """
+    returns whether the handler is a coroutine function, and whether
+    it accepts the connection as a second argument besides the event.
+    """
+    is_coroutine = iscoroutinefunction(handler)
+    try:
+        inspect.signature(handler).bind(None, None)  # type: ignore
+        accepts_connection = True
+    except TypeError:
+        accepts_connection = False
+    except ValueError:
+        # no signature available (some builtins), assume it does
+        accepts_connection = True
+    return is_coroutine, accepts_connection
+
+
 class ProtocolException(Exception):
     def __init__(self, *args, **kwargs):  # real signature unknown
         self.message = None
@@ -93,7 +157,9 @@ class Transaction(asyncio.Future):
 
     @property
     def message(self):
-        return json.dumps({"method": self.method, "params": self.params, "id": self.id})
+        return _json_dumps(
+            {"method": self.method, "params": self.params, "id": self.id}
+        )
 
     @property
     def has_exception(self):
@@ -139,31 +205,6 @@ class Transaction(asyncio.Future):
         return fmt
 
 
-class EventTransaction(Transaction):
-    event = None
-    value = None
-
-    def __init__(self, event_object):
-        try:
-            super().__init__(None)  # type: ignore
-        except Exception:
-            pass
-        self.set_result(event_object)
-        self.event = self.value = self.result()
-
-    def __repr__(self):
-        status = "finished"
-        success = False if self.exception() else True
-        event_object = self.result()
-        fmt = (
-            f"{self.__class__.__name__}\n\t"
-            f"event: {event_object.__class__.__module__}.{event_object.__class__.__name__}\n\t"
-            f"status: {status}\n\t"
-            f"success: {success}>"
-        )
-        return fmt
-
-
 class CantTouchThis(type):
     def __setattr__(cls, attr, value):
         """
@@ -207,6 +248,7 @@ class Connection(metaclass=CantTouchThis):
         )
         self.recv_task = None
         self.enabled_domains: list[Any] = []
+        self._handler_info: dict[Any, tuple[bool, bool]] = {}
         self._last_result: list[Any] = []
         self.listener: Listener | None = None
         self.__dict__.update(**kwargs)
@@ -258,18 +300,27 @@ class Connection(metaclass=CantTouchThis):
         :rtype:
         """
         if isinstance(event_type_or_domain, types.ModuleType):
-            for name, obj in inspect.getmembers_static(event_type_or_domain):
-                if name.isupper():
-                    continue
-                if not name[0].isupper():
-                    continue
-                if type(obj) is type:
-                    continue
-                if inspect.isbuiltin(obj):
-                    continue
-                self.handlers[obj].append(handler)
-            return
-        self.handlers[event_type_or_domain].append(handler)
+            for event_type in _get_domain_events(event_type_or_domain):
+                self.handlers[event_type].append(handler)
+        else:
+            self.handlers[event_type_or_domain].append(handler)
+        self._get_handler_info(handler)
+
+    def _get_handler_info(
+        self, handler: Union[Callable, Awaitable]
+    ) -> tuple[bool, bool]:
+        """
+        returns the cached result of inspecting a handler. handlers which were
+        assigned to :py:obj:`handlers` directly are inspected on first use.
+        """
+        try:
+            return self._handler_info[handler]
+        except KeyError:
+            info = self._handler_info[handler] = _inspect_handler(handler)
+            return info
+        except TypeError:
+            # unhashable callable, can't be cached
+            return _inspect_handler(handler)
 
     async def aopen(self, **kw):
         """
@@ -351,8 +402,7 @@ class Connection(metaclass=CantTouchThis):
         try:
             if isinstance(t, (int, float)):
                 await asyncio.wait_for(self.listener.idle.wait(), timeout=t)
-                while (loop.time() - start_time) < t:
-                    await asyncio.sleep(0.1)
+                await asyncio.sleep(max(0, t - (loop.time() - start_time)))
             else:
                 await self.listener.idle.wait()
         except asyncio.TimeoutError:
@@ -428,7 +478,7 @@ class Connection(metaclass=CantTouchThis):
             if not self.mapper:
                 self.__count__ = itertools.count(0)
             tx.id = next(self.__count__)
-            self.mapper.update({tx.id: tx})
+            self.mapper[tx.id] = tx
             if not _is_update:
                 await self._register_handlers()
             await self.websocket.send(tx.message)
@@ -454,7 +504,20 @@ class Connection(metaclass=CantTouchThis):
         # so at the end this variable will hold the domains that
         # are not represented by handlers, and can be removed
         enabled_domains = self.enabled_domains.copy()
-        for event_type in self.handlers.copy():
+        # forget the inspection results of handlers which have been removed.
+        # only once the cache holds more entries than there are registered
+        # handlers, which bounds its size without a rebuild on every send
+        if len(self._handler_info) > sum(map(len, self.handlers.values())):
+            live: set[Any] = set()
+            for handler in itertools.chain.from_iterable(self.handlers.values()):
+                try:
+                    live.add(handler)
+                except TypeError:
+                    # unhashable, so never cached
+                    continue
+            for handler in self._handler_info.keys() - live:
+                del self._handler_info[handler]
+        for event_type in list(self.handlers):
             if len(self.handlers[event_type]) == 0:
                 self.handlers.pop(event_type)
                 continue
@@ -540,7 +603,7 @@ class Connection(metaclass=CantTouchThis):
         tx = Transaction(cdp_obj)
         tx.connection = self
         tx.id = -2
-        self.mapper.update({tx.id: tx})
+        self.mapper[tx.id] = tx
         await self.websocket.send(tx.message)
         try:
             # in try except since if browser connection sends this it reises an exception
@@ -630,7 +693,7 @@ class Listener:
             # since we are at this point, we are not "idle" anymore.
             self.idle.clear()
 
-            message = json.loads(msg)
+            message = _json_loads(msg)
             if "id" in message:
                 # response to our command
                 if message["id"] in self.connection.mapper:
@@ -653,13 +716,13 @@ class Listener:
                         continue
             else:
                 # probably an event
+                # skip parsing events which nobody is listening to
+                event_type = cdp.util.get_event_class(message.get("method", ""))
+                callbacks = self.connection.handlers.get(event_type)
+                if not callbacks:
+                    continue
                 try:
-                    event = cdp.util.parse_json_event(message)
-                    event_tx = EventTransaction(event)
-                    if not self.connection.mapper:
-                        self.connection.__count__ = itertools.count(0)
-                    event_tx.id = next(self.connection.__count__)
-                    self.connection.mapper[event_tx.id] = event_tx
+                    event = event_type.from_json(message["params"])  # type: ignore
                 except Exception as e:
                     logger.info(
                         "%s: %s  during parsing of json from event : %s"
@@ -667,29 +730,20 @@ class Listener:
                         exc_info=True,
                     )
                     continue
-                except KeyError as e:
-                    logger.info("some lousy KeyError %s" % e, exc_info=True)
-                    continue
                 try:
-                    if type(event) in self.connection.handlers:
-                        callbacks = self.connection.handlers[type(event)]
-                    else:
-                        continue
-                    if not len(callbacks):
-                        continue
                     for callback in callbacks:
+                        is_coroutine, accepts_connection = (
+                            self.connection._get_handler_info(callback)
+                        )
+                        args = (
+                            (event, self.connection) if accepts_connection else (event,)
+                        )
+                        callback = typing.cast(Callable, callback)
                         try:
-                            if iscoroutinefunction(callback):
-                                try:
-                                    await callback(event, self.connection)
-                                except TypeError:
-                                    await callback(event)
+                            if is_coroutine:
+                                await callback(*args)
                             else:
-                                callback = typing.cast(Callable, callback)
-                                try:
-                                    callback(event, self.connection)
-                                except TypeError:
-                                    callback(event)
+                                callback(*args)
                         except Exception as e:
                             logger.warning(
                                 "exception in callback %s for event %s => %s",
@@ -698,10 +698,8 @@ class Element:
         :return: None
         """
         await self.apply("(elem) => elem.focus()")
-        [
+        for char in text:
             await self._tab.send(cdp.input_.dispatch_key_event("char", text=char))
-            for char in list(text)
-        ]
 
     async def send_file(self, *file_paths: PathLike):
         """
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import logging
 import types
 import typing
@@ -290,10 +291,14 @@ def loop():
     return loop
 
 
+@functools.lru_cache(maxsize=None)
 def cdp_get_module(domain: Union[str, types.ModuleType]):
     """
     get cdp module by given string
 
+    results are cached, as this is called for every registered event type
+    on each :py:meth:`Connection.send`.
+
     :param domain:
     :type domain:
     :return: